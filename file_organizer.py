@@ -1,4 +1,4 @@
-"""File Organizer
+r"""File Organizer
 
 Scans a directory and moves files into subfolders based on file extensions.
 
@@ -7,7 +7,8 @@ Features:
 - Recursive scanning option
 - Dry-run mode (no file system changes)
 - Logging of moved files to a CSV file and stdout summaries
-- Safe collision handling (appends counter suffix to avoid overwrites)
+- Safe collision handling (appends counter suffix to avoid overwrites),
+  or explicit replacement of existing files with --overwrite
 
 Usage examples:
     python file_organizer.py --path "C:\Users\You\Desktop" --dry-run
@@ -21,13 +22,17 @@ from __future__ import annotations
 
 import argparse
 import csv
-import logging
+import errno
+import os
 import sys
 import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 DEFAULT_MAP: Dict[str, str] = {
     # images
@@ -47,8 +52,41 @@ DEFAULT_MAP: Dict[str, str] = {
     '.py': 'Code', '.js': 'Code', '.ts': 'Code', '.java': 'Code', '.c': 'Code', '.cpp': 'Code', '.cs': 'Code', '.html': 'Code', '.css': 'Code',
 }
 
+# Buffer size for the log files, so a large run is flushed in a few writes.
+LOG_BUFFER_SIZE = 1024 * 1024
 
-@dataclass
+# Number of files planned, moved and logged together when streaming results.
+BATCH_SIZE = 1000
+
+# MoveResult reasons that count as skipped rather than failed.
+SKIP_REASONS = frozenset({'dry_run', 'already_in_target', 'same_path'})
+
+T = TypeVar('T')
+
+
+def expand_case_variants(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Return a copy of mapping that also holds upper- and title-case keys.
+
+    Lets the common spellings (``.jpg``, ``.JPG``, ``.Jpg``) resolve with a
+    single dict lookup and no ``lower()`` call per file.
+    """
+    expanded: Dict[str, str] = {}
+    for ext, folder in mapping.items():
+        ext = ext.lower()
+        for variant in (ext, ext.upper(), ext[:1] + ext[1:].capitalize()):
+            expanded[variant] = folder
+    return expanded
+
+
+_EXPANDED_MAP: Dict[str, str] = expand_case_variants(DEFAULT_MAP)
+
+
+# One MoveResult is kept per examined file, so drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+).
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MoveResult:
     src: Path
     dest: Path
@@ -56,28 +94,66 @@ class MoveResult:
     reason: Optional[str] = None
 
 
-def find_files(path: Path, recursive: bool) -> Iterable[Path]:
-    if recursive:
-        for p in path.rglob('*'):
-            if p.is_file():
-                yield p
-    else:
-        for p in path.iterdir():
-            if p.is_file():
-                yield p
+def find_files(path: Path, recursive: bool) -> Iterable[os.DirEntry]:
+    """Yield ``os.DirEntry`` objects for regular files under ``path``.
+
+    Entries carry the file type (and, once fetched, ``stat()``) cached from
+    the directory scan, so callers need no extra ``stat`` per file. Symlinks
+    are neither followed nor yielded. Subdirectories that cannot be read are
+    skipped; an unreadable ``path`` itself still raises.
+    """
+    root = os.fspath(path)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            if current == root:
+                raise
+            continue
+        with it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
 
 
 def ext_to_folder(extension: str, mapping: Dict[str, str]) -> str:
-    return mapping.get(extension.lower(), 'Others')
+    folder = mapping.get(extension)
+    if folder is None:
+        folder = mapping.get(extension.lower(), 'Others')
+    return folder
 
 
-def unique_destination(dest: Path) -> Path:
+def unique_destination(dest: Path, contents_cache: Optional[Dict[Path, Set[str]]] = None) -> Path:
     """If dest exists, append a numeric suffix before extension until unique.
 
+    With ``contents_cache``, collisions are checked against a set of names per
+    directory (filled by one ``os.scandir`` on first use) instead of a stat per
+    candidate; the chosen name is added to the set so pending moves are never
+    handed the same name twice.
+
     Examples:
         file.txt -> file (1).txt -> file (2).txt
     """
-    if not dest.exists():
+    names: Optional[Set[str]] = None
+    if contents_cache is not None:
+        names = contents_cache.get(dest.parent)
+        if names is None:
+            names = contents_cache[dest.parent] = _list_names(dest.parent)
+
+    def taken(candidate: Path) -> bool:
+        if names is None:
+            return candidate.exists()
+        # The set can miss names on case-insensitive filesystems, so the
+        # candidate it accepts is still confirmed with one stat.
+        hit = candidate.name in names or candidate.exists()
+        names.add(candidate.name)
+        return hit
+
+    if not taken(dest):
         return dest
 
     parent = dest.parent
@@ -87,106 +163,405 @@ def unique_destination(dest: Path) -> Path:
     idx = 1
     while True:
         candidate = parent / f"{stem} ({idx}){suffix}"
-        if not candidate.exists():
+        if not taken(candidate):
             return candidate
         idx += 1
 
 
-def move_file(src: Path, dest: Path, dry_run: bool) -> MoveResult:
+def _list_names(directory: Path) -> Set[str]:
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
+
+
+def _is_same_file(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+def _ensure_dir(path: Path, ensured_dirs: Optional[Set[str]]) -> None:
+    """Create path (and parents) unless it is already listed in ensured_dirs."""
+    key = os.fspath(path)
+    if ensured_dirs is not None and key in ensured_dirs:
+        return
+    os.makedirs(key, exist_ok=True)
+    if ensured_dirs is not None:
+        ensured_dirs.add(key)
+
+
+def move_file(
+    src: Path,
+    dest: Path,
+    dry_run: bool,
+    ensured_dirs: Optional[Set[str]] = None,
+    overwrite: bool = False,
+) -> MoveResult:
+    """Move src to dest, renaming on collision (or replacing dest if ``overwrite``).
+
+    Pass the same ``ensured_dirs`` set across calls to skip the ``mkdir``
+    for destination directories that were already created.
+    """
     dest_dir = dest.parent
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dest_dir, ensured_dirs)
 
-    if src.resolve() == dest.resolve():
+    if os.fspath(src) == os.fspath(dest):
         return MoveResult(src=src, dest=dest, moved=False, reason='same_path')
 
+    if overwrite:
+        if _is_same_file(src, dest):
+            return MoveResult(src=src, dest=dest, moved=False, reason='same_path')
+        return _do_move(src, dest, dry_run, overwrite=True)
+
     final_dest = unique_destination(dest)
+    # dest only needs a samefile check when it already exists (e.g. reached
+    # through a symlinked path); otherwise unique_destination returned it as is.
+    if final_dest != dest and _is_same_file(src, dest):
+        return MoveResult(src=src, dest=dest, moved=False, reason='same_path')
+
+    return _do_move(src, final_dest, dry_run)
 
+
+def _do_move(src: Path, final_dest: Path, dry_run: bool, overwrite: bool = False) -> MoveResult:
     if dry_run:
         return MoveResult(src=src, dest=final_dest, moved=False, reason='dry_run')
 
     try:
-        shutil.move(str(src), str(final_dest))
+        try:
+            # final_dest is either collision-free or meant to be replaced, so a
+            # single rename is all a same-filesystem move needs; only
+            # cross-device moves need copying.
+            if overwrite:
+                os.replace(os.fspath(src), os.fspath(final_dest))
+            else:
+                os.rename(os.fspath(src), os.fspath(final_dest))
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            _move_across_devices(src, final_dest, overwrite)
         return MoveResult(src=src, dest=final_dest, moved=True)
     except Exception as exc:  # broad exception just to report errors to the caller
         return MoveResult(src=src, dest=final_dest, moved=False, reason=str(exc))
 
 
-def organize(
+# errnos meaning "this kernel copy primitive can't be used here, try the next".
+_COPY_UNSUPPORTED = {
+    errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM, errno.EBADF, errno.ENOTSOCK,
+}
+
+
+def _copy_in_kernel(copy_chunk: Callable[[int, int, int, int], int], src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy size bytes with copy_chunk(src_fd, dst_fd, offset, count).
+
+    Returns False if the primitive is unsupported for these files (or copies
+    nothing at all, as some filesystems do); it can only report that before
+    the first byte is written. A copy that stops short later raises OSError.
+    """
+    offset = 0
+    while offset < size:
+        try:
+            sent = copy_chunk(src_fd, dst_fd, offset, size - offset)
+        except OSError as exc:
+            if offset == 0 and exc.errno in _COPY_UNSUPPORTED:
+                return False
+            raise
+        if sent == 0:
+            if offset == 0:
+                return False
+            raise OSError(errno.EIO, f"Short copy: {offset} of {size} bytes")
+        offset += sent
+    return True
+
+
+def _move_across_devices(src: Path, dest: Path, overwrite: bool) -> None:
+    """Copy src to dest (data and metadata) and then remove src.
+
+    The data is copied inside the kernel where possible: ``copy_file_range``
+    (which may reflink on btrfs/xfs), then ``sendfile`` (Linux only), and only
+    then a userspace ``shutil.copyfileobj``.
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    # Only Linux sendfile accepts a regular file as output; macOS/BSD want a socket.
+    sendfile = getattr(os, 'sendfile', None) if sys.platform.startswith('linux') else None
+
+    with open(src, 'rb') as fsrc:
+        if overwrite:
+            # Copy beside dest and swap it in only once complete, so a failed
+            # copy never truncates or removes the file being replaced.
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{dest.name}.", suffix='.part', dir=dest.parent)
+            fdst = os.fdopen(fd, 'wb')
+            target = Path(tmp_name)
+        else:
+            fdst = open(dest, 'xb')
+            target = dest
+        try:
+            with fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                size = os.fstat(src_fd).st_size
+                done = False
+                if copy_file_range is not None:
+                    done = _copy_in_kernel(
+                        lambda i, o, off, n: copy_file_range(i, o, n, off, off), src_fd, dst_fd, size
+                    )
+                if not done and sendfile is not None:
+                    done = _copy_in_kernel(
+                        lambda i, o, off, n: sendfile(o, i, off, n), src_fd, dst_fd, size
+                    )
+                if not done:
+                    shutil.copyfileobj(fsrc, fdst)
+            # Never remove the source unless the copy is complete.
+            copied = os.stat(target).st_size
+            if copied != size:
+                raise OSError(errno.EIO, f"Incomplete copy of {src}: {copied} of {size} bytes")
+            shutil.copystat(src, target)
+            if overwrite:
+                os.replace(target, dest)
+        except BaseException:
+            # Do not leave a partial copy behind (the source is still intact).
+            # target is always a file this call created, never a previous dest.
+            try:
+                os.unlink(target)
+            except OSError:
+                pass
+            raise
+
+    os.unlink(src)
+
+
+def _new_summary() -> Dict[str, int]:
+    return {'examined': 0, 'moved': 0, 'skipped': 0, 'errors': 0}
+
+
+def organize_iter(
     folder: Path,
     mapping: Optional[Dict[str, str]] = None,
     recursive: bool = False,
     dry_run: bool = False,
-) -> Tuple[List[MoveResult], Dict[str, int]]:
-) -> Tuple[List[MoveResult], Dict[str, int]]:
-    mapping = mapping or DEFAULT_MAP
-    results: List[MoveResult] = []
-
+    workers: int = 1,
+    overwrite: bool = False,
+) -> Iterator[Tuple[MoveResult, Dict[str, int]]]:
+    """Organize folder, yielding ``(result, summary)`` for each examined file.
+
+    ``summary`` is the running totals dict, updated in place as results are
+    yielded. Files are moved in batches of ``BATCH_SIZE``, so only one batch
+    of results is held in memory at a time. Without ``recursive`` the folder
+    is also scanned batch by batch; a recursive scan is finished (and all its
+    directory entries kept) before anything moves. Either way, the per-folder
+    name sets used for collision checks still grow with the number of files.
+    """
     if not folder.exists() or not folder.is_dir():
         raise FileNotFoundError(f"Folder does not exist: {folder}")
 
-    files = list(find_files(folder, recursive=recursive))
+    mapping = expand_case_variants(mapping) if mapping else _EXPANDED_MAP
+    return _organize_batches(folder, mapping, recursive, dry_run, workers, overwrite)
 
-    summary: Dict[str, int] = {'examined': 0, 'moved': 0, 'skipped': 0, 'errors': 0}
 
-    for file in files:
-        summary['examined'] += 1
+def _organize_batches(
+    folder: Path,
+    mapping: Dict[str, str],
+    recursive: bool,
+    dry_run: bool,
+    workers: int,
+    overwrite: bool,
+) -> Iterator[Tuple[MoveResult, Dict[str, int]]]:
+    # Resolve the root once; everything below it is scanned without following
+    # symlinks, so target directories and file parents are canonical as well.
+    # The resolved strings are only used for comparisons: reported (and moved)
+    # paths are rebuilt under folder as the caller spelled it.
+    root_resolved = Path(os.path.realpath(folder))
+    root_str = os.fspath(root_resolved)
+    cut = len(root_str)
+    shown_prefix = os.path.join(os.fspath(folder), '') if root_str.endswith(os.sep) else os.fspath(folder)
+    # folder name -> (target directory under folder, resolved string form,
+    # names already in it, normcased names handed out during this run)
+    resolved_targets: Dict[str, Tuple[Path, str, Set[str], Set[str]]] = {}
+
+    # A recursive scan is finished before anything moves, so files moved into
+    # new target folders are never picked up again. A flat scan can stream:
+    # moves only take entries out of the folder or add directories to it.
+    files: Iterable[os.DirEntry] = find_files(root_resolved, recursive=recursive)
+    if recursive:
+        files = list(files)
+
+    summary = _new_summary()
+    dir_contents: Dict[Path, Set[str]] = {}
+    ensured_dirs: Set[str] = set()
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    normcase = os.path.normcase
+
+    def target_for(folder_name: str) -> Tuple[Path, str, Set[str], Set[str]]:
+        target = resolved_targets.get(folder_name)
+        if target is None:
+            target_dir = folder / folder_name
+            if not dry_run:
+                _ensure_dir(target_dir, ensured_dirs)
+            # Shared with unique_destination's cache for this directory.
+            names = dir_contents[target_dir] = _list_names(target_dir)
+            # normcase so an existing 'images' folder matches 'Images' on Windows.
+            target_str = normcase(os.fspath(root_resolved / folder_name))
+            target = resolved_targets[folder_name] = (target_dir, target_str, names, set())
+        return target
+
+    # Local aliases for the per-file loop below.
+    lookup = mapping.get
+    dirname = os.path.dirname
+    lexists = os.path.lexists
+    sep = os.sep
 
-        extension = file.suffix.lower()
-        folder_name = ext_to_folder(extension, mapping)
+    try:
+        for chunk in _chunked(files, BATCH_SIZE):
+            # Plan the batch serially so destination directories and
+            # collision-free names are settled before any worker thread runs.
+            batch: List[Optional[MoveResult]] = []
+            planned: List[Tuple[int, Path, Path]] = []
+            for entry in chunk:
+                # Work on the entry's strings here; a Path is only built for results.
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0:
+                    extension = name[dot:]
+                    folder_name = lookup(extension) or lookup(extension.lower(), 'Others')
+                else:
+                    folder_name = lookup('', 'Others')
+
+                target_dir, target_str, names, claimed = target_for(folder_name)
+                dest_path = target_dir / name
+
+                # Skip moving if file is already in the destination folder path
+                if normcase(dirname(entry.path)) == target_str:
+                    src = Path(shown_prefix + entry.path[cut:])
+                    batch.append(MoveResult(src=src, dest=dest_path, moved=False, reason='already_in_target'))
+                    continue
+
+                # Fast path for the usual no-collision case, on plain strings;
+                # unique_destination only runs when the name is taken. With
+                # overwrite, only files that were there before the run are
+                # replaced: a name already handed out in this run is renamed.
+                if overwrite and normcase(name) not in claimed:
+                    names.add(name)
+                    final_dest = dest_path
+                elif name not in names and not lexists(target_str + sep + name):
+                    names.add(name)
+                    final_dest = dest_path
+                else:
+                    final_dest = unique_destination(dest_path, dir_contents)
+                claimed.add(normcase(final_dest.name))
+                planned.append((len(batch), Path(shown_prefix + entry.path[cut:]), final_dest))
+                batch.append(None)
+
+            if executor is not None and len(planned) > 1:
+                outcomes = list(executor.map(lambda p: _do_move(p[1], p[2], dry_run, overwrite), planned))
+            else:
+                outcomes = [_do_move(src, dest, dry_run, overwrite) for _, src, dest in planned]
 
-        target_dir = folder / folder_name
-        dest_path = target_dir / file.name
+            for (idx, _, _), res in zip(planned, outcomes):
+                batch[idx] = res
 
-        # Skip moving if file is already in the destination folder path
-        try:
-            # Use parts comparison so we can detect nested location by name too
-            if file.parent.resolve() == target_dir.resolve():
-                results.append(MoveResult(src=file, dest=dest_path, moved=False, reason='already_in_target'))
-                summary['skipped'] += 1
-                continue
-        except Exception:
-            # ignore resolution errors
-            pass
+            for res in batch:
+                summary['examined'] += 1
+                if res.moved:
+                    summary['moved'] += 1
+                elif res.reason in SKIP_REASONS:
+                    summary['skipped'] += 1
+                else:
+                    summary['errors'] += 1
+                yield res, summary
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-        res = move_file(file, dest_path, dry_run=dry_run)
+
+def organize(
+    folder: Path,
+    mapping: Optional[Dict[str, str]] = None,
+    recursive: bool = False,
+    dry_run: bool = False,
+    workers: int = 1,
+    overwrite: bool = False,
+) -> Tuple[List[MoveResult], Dict[str, int]]:
+    """Organize folder and return all results plus the summary counts.
+
+    See ``organize_iter`` for a streaming variant.
+    """
+    results: List[MoveResult] = []
+    summary = _new_summary()
+    for res, summary in organize_iter(
+        folder,
+        mapping=mapping,
+        recursive=recursive,
+        dry_run=dry_run,
+        workers=workers,
+        overwrite=overwrite,
+    ):
         results.append(res)
-        if res.moved:
-            summary['moved'] += 1
-        else:
-            if res.reason == 'dry_run' or res.reason == 'already_in_target' or res.reason == 'same_path':
-                summary['skipped'] += 1
-            else:
-                summary['errors'] += 1
 
     return results, summary
 
-    return results, summary
 
+def _chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class CSVLogger:
+    """Append MoveResults to a CSV log, keeping the file open between calls.
 
-def write_log_csv(csv_path: Path, results: List[MoveResult]) -> None:
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    Useful when ``organize()`` runs several times in one process: the file is
+    opened (and its header checked) once, and rows are flushed on close.
+
+        with CSVLogger(path) as log:
+            log.log(results)
+    """
 
     header = ['timestamp', 'src', 'dest', 'moved', 'reason']
 
-    with csv_path.open('a', newline='', encoding='utf-8') as fh:
-        writer = csv.writer(fh)
+    def __init__(self, csv_path: Path) -> None:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fh = csv_path.open('a', newline='', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
+        self.writer = csv.writer(self.fh)
         # Add header if file is empty
         if csv_path.stat().st_size == 0:
-            writer.writerow(header)
+            self.writer.writerow(self.header)
+
+    def log(self, results: Iterable[MoveResult]) -> None:
+        ts = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        for chunk in _chunked(results, BATCH_SIZE):
+            self.writer.writerows([[ts, str(r.src), str(r.dest), str(r.moved), r.reason or ''] for r in chunk])
 
-        ts = datetime.utcnow().isoformat() + 'Z'
-        for r in results:
-            writer.writerow([ts, str(r.src), str(r.dest), str(r.moved), r.reason or ''])
+    def close(self) -> None:
+        if not self.fh.closed:
+            self.fh.flush()
+            self.fh.close()
 
+    def __enter__(self) -> CSVLogger:
+        return self
 
-def write_human_log(log_path: Path, results: List[MoveResult]) -> None:
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_log_csv(csv_path: Path, results: Iterable[MoveResult]) -> None:
+    with CSVLogger(csv_path) as log:
+        log.log(results)
+
+
+def write_human_log(log_path: Path, results: Iterable[MoveResult]) -> None:
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with log_path.open('a', encoding='utf-8') as fh:
-        ts = datetime.utcnow().isoformat() + 'Z'
-        for r in results:
-            line = f"{ts}\t{r.src}\t->\t{r.dest}\tmoved={r.moved}\t{r.reason or ''}\n"
-            fh.write(line)
+    with log_path.open('a', encoding='utf-8', buffering=LOG_BUFFER_SIZE) as fh:
+        ts = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        for chunk in _chunked(results, BATCH_SIZE):
+            fh.write(''.join(
+                f"{ts}\t{r.src}\t->\t{r.dest}\tmoved={r.moved}\t{r.reason or ''}\n" for r in chunk
+            ))
 
 
 def parse_args() -> argparse.Namespace:
@@ -197,6 +572,9 @@ def parse_args() -> argparse.Namespace:
     p.add_argument('--log', help='Path to CSV log file where moves are appended (default: ./organizer_log.csv)')
     p.add_argument('--log-human', help='Path to a human readable log file for moved files (optional)')
     p.add_argument('--map', help='Optional mapping CSV (ext,folder) to override/extend defaults')
+    p.add_argument('--overwrite', action='store_true',
+                   help='Replace existing files in the destination instead of renaming the moved file')
+    p.add_argument('--workers', type=int, default=1, help='Number of threads used to move files (default: 1)')
     return p.parse_args()
 
 
@@ -228,34 +606,41 @@ def main() -> None:
     log_path = Path(args.log) if args.log else Path.cwd() / 'organizer_log.csv'
     human_log_path = Path(args.log_human) if getattr(args, 'log_human', None) else None
 
-    # Setup console logger for warnings/errors
-    logger = logging.getLogger('file_organizer')
-    logger.setLevel(logging.INFO)
-    handler = logging.StreamHandler(stream=sys.stdout)
-    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s'))
-    logger.addHandler(handler)
-
     print(f"Scanning: {folder}")
     print(f"Recursive: {args.recursive}, Dry-run: {args.dry_run}")
     print(f"Log file: {log_path}")
 
-    results, summary = organize(folder, mapping=mapping, recursive=args.recursive, dry_run=args.dry_run)
-
-    # Write logs
-    if log_path:
-        write_log_csv(log_path, results)
-    if human_log_path:
-        write_human_log(human_log_path, results)
-
-    # Add console logging for moved items and warnings
-    for r in results:
-        if r.moved:
-            logger.info(f"Moved: {r.src} -> {r.dest}")
-        else:
-            if r.reason in ('dry_run', 'already_in_target', 'same_path'):
-                logger.debug(f"Skipped: {r.src} -> reason={r.reason}")
-            else:
-                logger.warning(f"Failed to move {r.src} -> {r.dest} (reason={r.reason})")
+    stream = organize_iter(
+        folder,
+        mapping=mapping,
+        recursive=args.recursive,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        overwrite=args.overwrite,
+    )
+
+    # Write logs and console output batch by batch as results arrive
+    summary = _new_summary()
+    with CSVLogger(log_path) as csv_log:
+        for chunk in _chunked(stream, BATCH_SIZE):
+            summary = chunk[-1][1]
+            results = [r for r, _ in chunk]
+
+            csv_log.log(results)
+            if human_log_path:
+                write_human_log(human_log_path, results)
+
+            # Report moved items and failures with one write per stream
+            moved_lines = [f"Moved: {r.src} -> {r.dest}\n" for r in results if r.moved]
+            failed_lines = [
+                f"Failed to move {r.src} -> {r.dest} (reason={r.reason})\n"
+                for r in results
+                if not r.moved and r.reason not in SKIP_REASONS
+            ]
+            if moved_lines:
+                sys.stdout.write(''.join(moved_lines))
+            if failed_lines:
+                sys.stderr.write(''.join(failed_lines))
 
     print('\nSummary:')
     print(f"  Examined: {summary['examined']}")